@@ -2,6 +2,11 @@
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class BacklogBase:
     def __init__(self) -> None:
         self.data = []
@@ -10,15 +15,23 @@ class BacklogBase:
         if sort_key := getattr(self, 'sort_key', None):
             self.data.sort(key=sort_key)
 
-    def write(self, target: Path):
+    def write(self, target: Path, pretty: bool = False):
         self.sort()
 
-        target.write_bytes(
-            json.dumps(self.data, indent=2).encode('utf-8')
-        )
+        if orjson is None:
+            if pretty:
+                text = json.dumps(self.data, indent=2, ensure_ascii=False)
+            else:
+                text = json.dumps(self.data, separators=(',', ':'), ensure_ascii=False)
+            target.write_bytes(text.encode('utf-8'))
+            return
+
+        target.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2 if pretty else 0))
 
     def __str__(self):
-        return '\n'.join(json.dumps(item) for item in self.data)
+        if orjson is None:
+            return '\n'.join(json.dumps(item, separators=(',', ':'), ensure_ascii=False) for item in self.data)
+        return '\n'.join(orjson.dumps(item).decode('utf-8') for item in self.data)
 
     def __len__(self):
         return len(self.data)
@@ -3,13 +3,14 @@ import re
 import string
 from contextlib import suppress
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
 strikethrough_pattern = re.compile(r'(~+)([^~]+)\1')
 
 
-@dataclass
+@dataclass(slots=True)
 class SheetCell:
     value: str
     links: List[str]
@@ -76,17 +77,22 @@ class SheetCell:
         if link and urlparse(link).netloc and link not in links:
             links.append(link)
 
-        return cls(value=value, links=links, note=note, done=done)
+        # every consumer wants the value without surrounding whitespace
+        return cls(value=value.strip(), links=links, note=note, done=done)
 
     @property
     def first_link(self) -> Optional[str]:
         return next(iter(self.links), None)
 
 
-@dataclass
+@dataclass(slots=True)
 class SheetRow:
     num: int
     cells: List[SheetCell]
+    checkboxes: List[bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.checkboxes = [c.value == 'TRUE' for c in self.cells if c.value in ('TRUE', 'FALSE')]
 
     @classmethod
     def parse(cls, row: List[dict], num: int, fill: int):
@@ -99,7 +105,7 @@ class SheetRow:
         return cls(num=num, cells=cells)
 
     def is_done(self, which: int = 1) -> bool:
-        checkboxes = [c.value == 'TRUE' for c in self.cells if c.value in ('TRUE', 'FALSE')]
+        checkboxes = self.checkboxes
         if not checkboxes:
             raise self.CheckboxNotFound('No checkboxes found!', self.num)
 
@@ -161,28 +167,26 @@ class Sheet:
         ]
 
         col_count = len(self.columns)
-        for num, row in enumerate(row_data[data_row:], (self.frozen_row_count or 0) + 1):
+        for num, row in enumerate(islice(row_data, data_row, None), (self.frozen_row_count or 0) + 1):
             row_obj = SheetRow.parse(row['values'], num, fill=col_count)
             self.rows.append(row_obj)
 
         # noop
         setattr(self, 'parse_data', lambda: None)
 
-    def get_column_index(self, text: Union[str, re.Pattern]) -> int:
-        for idx, col in enumerate(self.columns):
-            if isinstance(text, re.Pattern) and text.search(col):
-                return idx
-            if isinstance(text, str) and text in col:
-                return idx
+    @staticmethod
+    def _column_matcher(text: Union[str, re.Pattern]) -> Callable[[str], Any]:
+        if isinstance(text, re.Pattern):
+            return text.search
+        return lambda col: text in col
 
-        return -1
+    def get_column_index(self, text: Union[str, re.Pattern]) -> int:
+        matches = self._column_matcher(text)
+        return next((idx for idx, col in enumerate(self.columns) if matches(col)), -1)
 
     def get_all_column_indices(self, text: Union[str, re.Pattern]) -> List[int]:
-        return [
-            idx for idx, col in enumerate(self.columns)
-            if isinstance(text, re.Pattern) and text.search(col)
-            or isinstance(text, str) and text in col
-        ]
+        matches = self._column_matcher(text)
+        return [idx for idx, col in enumerate(self.columns) if matches(col)]
 
 
 """
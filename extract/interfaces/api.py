@@ -2,10 +2,8 @@
 import json
 from typing import List
 
-import requests
-
 from ..classes import Sheet
-from .base import InterfaceBase
+from .base import InterfaceBase, conditional_get
 
 
 class DataInterface(InterfaceBase[Sheet]):
@@ -28,7 +26,7 @@ class DataInterface(InterfaceBase[Sheet]):
             raise self.MissingAPIKey(f'Google API key is required.')
 
         print('fetching spreadsheet via API...')
-        resp = requests.get(
+        resp, chunks = conditional_get(
             url=f'https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}',
             headers={
                 'User-Agent': 'Backlog Exporter (gzip)',
@@ -41,8 +39,11 @@ class DataInterface(InterfaceBase[Sheet]):
             },
         )
 
+        with resp:
+            content = b''.join(chunks)
+
         try:
-            data = resp.json()
+            data = json.loads(content)
         except ValueError:
             data = {}
 
@@ -55,7 +56,7 @@ class DataInterface(InterfaceBase[Sheet]):
                 print(error)
 
         if not resp.ok:
-            details = '.' if data else f': {resp.text}'
+            details = '.' if data else f": {content.decode('utf-8', 'replace')}"
             raise Exception('Request failed' + details)
 
         for sheet in data['sheets']:
@@ -1,9 +1,18 @@
 # coding: utf-8
-from typing import Dict, Generic, TypeVar
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Generic, Iterator, Optional, Tuple, TypeVar
+
+import requests
+
+from ..paths import cache_dir
 
 
 T = TypeVar('T')
 
+session = requests.Session()
+
 class InterfaceBase(Generic[T]):
 
     def __init__(self):
@@ -11,3 +20,55 @@ class InterfaceBase(Generic[T]):
 
     def get_sheet(self, sheet_id: int):
         return self._sheets[sheet_id]
+
+
+CHUNK_SIZE = 1 << 16
+
+
+def conditional_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Tuple[requests.Response, Iterator[bytes]]:
+    """
+    GET `url`, revalidating the body stored by a previous run against its `ETag` / `Last-Modified`.
+
+    Returns the response and an iterator over its body, which is streamed from the network
+    as it is consumed, or comes from the cache on `304 Not Modified`.
+    """
+    key = hashlib.sha1(json.dumps([url, params], sort_keys=True).encode('utf-8')).hexdigest()
+    meta_path = cache_dir / f'{key}.json'
+    body_path = cache_dir / f'{key}.body'
+
+    headers = dict(headers or {})
+    if meta_path.is_file() and body_path.is_file():
+        meta: Dict[str, str] = json.loads(meta_path.read_bytes())
+        if etag := meta.get('etag'):
+            headers['If-None-Match'] = etag
+        if last_modified := meta.get('last_modified'):
+            headers['If-Modified-Since'] = last_modified
+
+    resp = session.get(url, headers=headers, params=params, stream=True)
+
+    if resp.status_code == 304:
+        print('not modified, using cached response')
+        return resp, iter((body_path.read_bytes(),))
+
+    etag = resp.headers.get('ETag')
+    last_modified = resp.headers.get('Last-Modified')
+    if resp.status_code == 200 and (etag or last_modified):
+        meta = {'etag': etag, 'last_modified': last_modified}
+        return resp, _write_through(resp, meta_path, body_path, meta)
+
+    return resp, resp.iter_content(CHUNK_SIZE)
+
+
+def _write_through(resp: requests.Response, meta_path: Path, body_path: Path, meta: Dict[str, Optional[str]]):
+    # the validators are only stored once the whole body has been written
+    cache_dir.mkdir(exist_ok=True)
+    meta_path.unlink(missing_ok=True)
+    with body_path.open('wb') as f:
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            f.write(chunk)
+            yield chunk
+    meta_path.write_text(json.dumps(meta))
@@ -1,15 +1,22 @@
 # coding: utf-8
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Union
-from urllib.parse import parse_qsl, urlparse
+from functools import lru_cache
+from itertools import islice
+from typing import FrozenSet, List, Optional, Set
+from urllib.parse import unquote_plus
 
-import bs4
-import cssutils
-import requests
+import lxml.html
+from lxml import etree
 
 from ..classes import Sheet, SheetCell, SheetRow
-from .base import InterfaceBase
+from .base import InterfaceBase, conditional_get
+
+CSS_RULE_PATTERN = re.compile(r'([^{}]+)\{([^{}]*)\}')
+LINE_THROUGH_PATTERN = re.compile(r'(?:^|;)\s*text-decoration\s*:\s*line-through\s*(?:;|$)', re.I)
+GOOGLE_REDIRECT_PATTERN = re.compile(r'https?://www\.google\.com/url\?([^#]*)', re.I)
+GOOGLE_REDIRECT_TARGET_PATTERN = re.compile(r'(?:^|&)q=([^&]+)')
+MULTILINE_TEXT_XPATH = etree.XPath('descendant::text() | descendant::br', smart_strings=False)
 
 
 class HTMLInterface(InterfaceBase['LegacySheet']):
@@ -18,14 +25,20 @@ class HTMLInterface(InterfaceBase['LegacySheet']):
         super(HTMLInterface, self).__init__()
 
         print('fetching HTML spreadsheet...')
-        resp = requests.get(f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/htmlview')
-        resp.raise_for_status()
+        resp, chunks = conditional_get(f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/htmlview')
+        # the body is streamed, so make sure the connection is released on errors as well
+        with resp:
+            resp.raise_for_status()
 
-        soup = bs4.BeautifulSoup(resp.text, 'html.parser')
+            # feed the raw bytes to libxml2 as they arrive, instead of buffering the whole page first
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            for chunk in chunks:
+                parser.feed(chunk)
+        root: lxml.html.HtmlElement = parser.close()
 
         for sheet_id in sheet_ids:
             try:
-                self._sheets[sheet_id] = LegacySheet.parse(soup=soup, sheet_id=sheet_id)
+                self._sheets[sheet_id] = LegacySheet.parse(root=root, sheet_id=sheet_id)
             except Exception as error:
                 raise Exception(f'Failed to parse sheet ({sheet_id})') from error
 
@@ -33,59 +46,68 @@ class HTMLInterface(InterfaceBase['LegacySheet']):
         return self._sheets[sheet_id]
 
 
-@dataclass
+@dataclass(slots=True)
 class LegacySheetCell(SheetCell):
 
     @classmethod
-    def parse(cls, cell: bs4.element.Tag, done: bool):
-        value = get_multiline_text(cell)
+    def parse(cls, cell: lxml.html.HtmlElement, done: bool):
+        value: str = cell.text or ''
+        links: List[str] = []
 
-        if checkbox := cell.select_one('use[href$="CheckboxId"], use[xlink\\:href$="CheckboxId"]'):
-            try:
-                href = checkbox.attrs['href']
-            except KeyError:
-                href = checkbox.attrs['xlink:href']
+        # empty and plain-text cells (the majority) have no line breaks, checkboxes or links
+        if len(cell):
+            value = get_multiline_text(cell)
 
-            value = str(href == '#checkedCheckboxId').upper()
+            for checkbox in cell.iter('use'):
+                href: str = checkbox.get('href') or checkbox.get('xlink:href') or ''
+                if href.endswith('CheckboxId'):
+                    value = str(href == '#checkedCheckboxId').upper()
+                    break
 
-        links: List[str] = []
-        if link := get_cell_url(cell):
-            links.append(link)
+            if link := get_cell_url(cell):
+                links.append(link)
 
         return cls(
-            value=value,
+            value=value.strip(),
             links=links,
             note='',
             done=done,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LegacySheetRow(SheetRow):
     cells: List[LegacySheetCell]
 
     @classmethod
-    def parse(cls, row: bs4.element.Tag, done_classes: Set[str]):
+    def parse(cls, row: lxml.html.HtmlElement, done_classes: FrozenSet[str]):
 
-        def is_done(cell: bs4.element.Tag):
-            classes: Optional[List[str]] = cell.attrs.get('class')  # type: ignore
+        def is_done(cell: lxml.html.HtmlElement):
+            # no line-through styles in the document, nothing can be done
+            if not done_classes:
+                return False
+            classes: Optional[str] = cell.get('class')
             if classes:
-                return any(c in done_classes for c in classes)
+                return not done_classes.isdisjoint(classes.split())
             return False
 
-        cells = [
-            LegacySheetCell.parse(cell, is_done(cell))
-            for cell in row.select('td')
-        ]
-        obj = cls(num=cls.get_row_num(row), cells=cells)
+        # collect the gutter and the cells in a single pass over the row's children
+        gutter: Optional[lxml.html.HtmlElement] = None
+        cells: List[LegacySheetCell] = []
+        for child in row:
+            if child.tag == 'td':
+                cells.append(LegacySheetCell.parse(child, is_done(child)))
+            elif child.tag == 'th' and gutter is None:
+                gutter = child
+
+        obj = cls(num=cls.get_row_num(gutter), cells=cells)
         return obj
 
     @staticmethod
-    def get_row_num(row: bs4.element.Tag):
-        gutter: Optional[bs4.element.Tag] = row.select_one('th')
-        if not gutter:
+    def get_row_num(gutter: Optional[lxml.html.HtmlElement]):
+        if gutter is None:
             raise Exception('Failed to get row number')
-        return int(gutter.text)
+        return int(gutter.text_content())
 
     class CheckboxNotFound(Exception):
         ...
@@ -96,27 +118,27 @@ class LegacySheet(Sheet):
     rows: List[LegacySheetRow] = field(default_factory=list, repr=False)
 
     @classmethod
-    def parse(cls, soup: bs4.BeautifulSoup, sheet_id: int):
-        sheet = soup.select_one(f'div[id="{sheet_id}"]')
-        if not sheet:
+    def parse(cls, root: lxml.html.HtmlElement, sheet_id: int):
+        sheet = root.find(f'.//div[@id="{sheet_id}"]')
+        if sheet is None:
             raise Exception('ERROR: Sheet not found')
 
-        if title := soup.select_one(f'li[id="sheet-button-{sheet_id}"] > a'):
-            title = title.get_text(strip=True)
+        if (title := root.find(f'.//li[@id="sheet-button-{sheet_id}"]/a')) is not None:
+            title = title.text_content().strip()
         else:
             title = '<unknown>'
 
+        all_rows = sheet.findall('.//tbody/tr')
+
         self = cls(
             id=sheet_id,
             title=title,
             row_count=(-1),
             column_count=(-1),
-            frozen_row_count=get_frozen_row_count(sheet),
+            frozen_row_count=get_frozen_row_count(all_rows),
             frozen_column_count=(-1),
         )
 
-        all_rows = sheet.select('tbody > tr')
-
         # if frozen row is not set (== 0), fail
         if not self.frozen_row_count:
             raise ValueError(f'Frozen Row Count is undefined ({self.frozen_row_count})')
@@ -126,13 +148,13 @@ class LegacySheet(Sheet):
         data_row = (self.frozen_row_count + 1) if self.frozen_row_count else 1
 
         self.columns = [
-            col.get_text()
-            for col in all_rows[head_row].select('td')
+            col.text_content()
+            for col in all_rows[head_row].findall('td')
         ]
 
-        done_classes = get_done_classes(soup)
+        done_classes = get_done_classes(root)
 
-        for row in all_rows[data_row:]:
+        for row in islice(all_rows, data_row, None):
             row_obj = LegacySheetRow.parse(row, done_classes)
             self.rows.append(row_obj)
 
@@ -141,89 +163,68 @@ class LegacySheet(Sheet):
     def parse_data(self, *args, **kwargs):
         pass
 
-    def get_column_index(self, text: Union[str, re.Pattern, None]) -> int:
-        for idx, col in enumerate(self.columns):
-            if isinstance(text, re.Pattern) and text.search(col):
-                return idx
-            if isinstance(text, str) and text in col:
-                return idx
-
-        return -1
-
-    def get_all_column_indices(self, text: Union[str, re.Pattern, None]) -> List[int]:
-        return [
-            idx for idx, col in enumerate(self.columns)
-            if isinstance(text, re.Pattern) and text.search(col)
-            or isinstance(text, str) and text in col
-        ]
-
-
-def get_frozen_row_count(sheet: bs4.element.Tag) -> int:
-    all_rows = sheet.select('tbody > tr')
 
+def get_frozen_row_count(all_rows: List[lxml.html.HtmlElement]) -> int:
+    # the frozen rows are at the top, so stop at the first <tr> holding the handle:
     # <th style="height:3px;" class="freezebar-cell freezebar-horizontal-handle">
-    frozen_row_handle = sheet.select_one('.freezebar-horizontal-handle')
-    if not frozen_row_handle:
-        raise Exception('ERROR: Frozen row handler not found')
-
-    # <tr>
-    frozen_row: Optional[bs4.element.Tag] = frozen_row_handle.parent
-    if not frozen_row:
-        raise Exception('ERROR: Frozen row not found')
+    for idx, row in enumerate(all_rows):
+        for cell in row:
+            if 'freezebar-horizontal-handle' in (cell.get('class') or '').split():
+                return idx
 
-    return all_rows.index(frozen_row)
+    raise Exception('ERROR: Frozen row handler not found')
 
 
-def get_done_classes(soup: bs4.BeautifulSoup) -> Set[str]:
+def get_done_classes(root: lxml.html.HtmlElement) -> FrozenSet[str]:
     """Find the class names that are strike/line-through (partially completed entries)."""
-    classes: Set[str] = set()
-
-    if not soup:
+    if root is None:
         print('WARNING: Unable to determine partially completed entries')
-        return classes
+        return frozenset()
 
-    style: Optional[bs4.element.Tag] = soup.select_one('head > style')
+    style: Optional[lxml.html.HtmlElement] = root.find('head/style')
     if style is None:
         print('WARNING: Unable to determine partially completed entries')
-        return classes
+        return frozenset()
 
-    stylesheet = cssutils.parseString(style.decode_contents(), validate=False)
+    return parse_done_classes(style.text or '')
 
-    for rule in stylesheet:
-        if rule.type == rule.STYLE_RULE and rule.style.textDecoration == 'line-through':
-            selector: str = rule.selectorText
-            classes.update(c.lstrip('.') for c in selector.split(' ') if c.startswith('.s'))
 
-    return classes
+@lru_cache(maxsize=8)
+def parse_done_classes(style_text: str) -> FrozenSet[str]:
+    """Every sheet of the document shares the same stylesheet, so it only needs to be scanned once."""
+    classes: Set[str] = set()
+
+    for selector, declarations in CSS_RULE_PATTERN.findall(style_text):
+        if LINE_THROUGH_PATTERN.search(declarations):
+            classes.update(c.lstrip('.') for c in selector.replace(',', ' ').split() if c.startswith('.s'))
+
+    return frozenset(classes)
 
 
 def parse_google_redirect_url(url: Optional[str]) -> Optional[str]:
     if not url:
         return None
 
-    try:
-        url_p = urlparse(url)
-
-        if url_p.hostname == 'www.google.com' and url_p.path == '/url':
-            url_r = dict(parse_qsl(url_p.query))['q']
-            url = urlparse(url_r).geturl()
-
+    redirect = GOOGLE_REDIRECT_PATTERN.match(url)
+    # direct links are the common case
+    if redirect is None:
         return url
 
-    except (ValueError, KeyError):
-        return None
+    # like parse_qsl, the last non-blank `q` wins
+    if targets := GOOGLE_REDIRECT_TARGET_PATTERN.findall(redirect.group(1)):
+        return unquote_plus(targets[-1])
+    return None
 
 
-def get_cell_url(cell: bs4.element.Tag) -> Optional[str]:
-    try:
-        return parse_google_redirect_url(
-            cell.select_one('a').attrs['href']  # type: ignore
-        )
-    except (AttributeError, KeyError):
+def get_cell_url(cell: lxml.html.HtmlElement) -> Optional[str]:
+    if (link := cell.find('.//a[@href]')) is None:
         return None
+    return parse_google_redirect_url(link.get('href'))
 
 
-def get_multiline_text(cell: bs4.element.Tag, **get_text_kwargs) -> str:
-    for br in cell.find_all('br'):
-        br.replace_with('\n')  # type: ignore
-    return cell.get_text(**get_text_kwargs)
+def get_multiline_text(cell: lxml.html.HtmlElement) -> str:
+    """Get the cell's text with `<br>` tags as line breaks, in a single pass over its descendants."""
+    return ''.join(
+        node if isinstance(node, str) else '\n'
+        for node in MULTILINE_TEXT_XPATH(cell)
+    )
@@ -8,46 +8,61 @@ from .utils import get_google_api_key, get_proxy
 def main():
     def main_scene_performers(**kwargs):
         data = api.scene_performers(**kwargs)
-        data.write(paths.path_scene_performers)
+        data.write(paths.path_scene_performers, pretty=pretty)
         print(f'Success: {len(data)} scene entries')
 
     def main_scenes_fixes():
         data = api.scene_fixes()
-        data.write(paths.path_scene_fixes)
+        data.write(paths.path_scene_fixes, pretty=pretty)
         print(f'Success: {len(data)} scene entries')
 
     def main_duplicate_scenes():
         data = api.duplicate_scenes()
-        data.write(paths.path_duplicate_scenes)
+        data.write(paths.path_duplicate_scenes, pretty=pretty)
         print(f'Success: {len(data)} scene entries')
 
     def main_duplicate_performers():
         data = api.duplicate_performers()
-        data.write(paths.path_duplicate_performers)
+        data.write(paths.path_duplicate_performers, pretty=pretty)
         print(f'Success: {len(data)} performer entries')
 
     def main_scene_fingerprints():
         data = api.scene_fingerprints()
-        data.write(paths.path_scene_fingerprints)
+        data.write(paths.path_scene_fingerprints, pretty=pretty)
         print(f'Success: {len(data)} scene entries')
 
     def main_performers_to_split_up(**kwargs):
         data = api.performers_to_split_up(**kwargs)
-        data.write(paths.path_performers_to_split_up)
+        data.write(paths.path_performers_to_split_up, pretty=pretty)
         print(f'Success: {len(data)} performer entries')
 
     def main_performer_urls():
         data = api.performer_urls()
-        data.write(paths.path_performer_urls)
+        data.write(paths.path_performer_urls, pretty=pretty)
         print(f'Success: {len(data)} performer entries')
 
+    def main_all():
+        for title, main_method in (
+            ('Scene-Performers', main_scene_performers),
+            ('Scene Fixes', main_scenes_fixes),
+            ('Duplicate Scenes', main_duplicate_scenes),
+            ('Duplicate Performers', main_duplicate_performers),
+            ('Scene Fingerprints', main_scene_fingerprints),
+            ('Performers To Split Up', main_performers_to_split_up),
+            ('Performer URLs', main_performer_urls),
+        ):
+            print(f'>>> {title}')
+            main_method()
+
     class Arguments(argparse.Namespace):
         main_method: Callable[[], None]
         legacy: bool
+        pretty: bool
 
     parser = argparse.ArgumentParser('Extract Sheet Data')
     parser.set_defaults(main_method=main_scene_performers)
     parser.add_argument('-l', '--legacy', action='store_true', help='Force legacy extractor.')
+    parser.add_argument('-p', '--pretty', action='store_true', help='Indent the output JSON file.')
 
     subparsers = parser.add_subparsers(help='What')
 
@@ -84,6 +99,9 @@ def main():
     subparsers.add_parser(name='pu', help="Performer URLs") \
         .set_defaults(main_method=main_performer_urls)
 
+    subparsers.add_parser(name='all', help="All of the above, from a single fetch") \
+        .set_defaults(main_method=main_all)
+
     args = parser.parse_args(namespace=Arguments())
 
     kwargs = {
@@ -92,6 +110,7 @@ def main():
     }
 
     api_key = None if args.legacy else get_google_api_key()
+    pretty = args.pretty
 
     if proxy := get_proxy():
         os.environ['ALL_PROXY'] = proxy
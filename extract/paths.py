@@ -2,6 +2,8 @@ from pathlib import Path
 
 module_dir = Path(__file__).resolve().parent
 script_dir = module_dir.parent
+cache_dir = script_dir / '.cache'
+env_file = script_dir / '.env'
 
 path_scene_performers = module_dir / 'scene_performers.json'
 path_scene_fixes = module_dir / 'scene_fixes.json'
@@ -1,6 +1,6 @@
 # coding: utf-8
-import re
-from typing import List, NamedTuple, Optional
+import sys
+from typing import List, NamedTuple, Optional, Set
 
 from ..base import BacklogBase
 from ..classes import Sheet, SheetCell, SheetRow
@@ -12,9 +12,9 @@ class DuplicatePerformers(BacklogBase):
     def __init__(self, sheet: Sheet, skip_done: bool):
         self.skip_done = skip_done
 
-        self.column_name    = sheet.get_column_index(re.compile('Performer'))
-        self.column_main_id = sheet.get_column_index(re.compile('Main ID'))
-        self.column_user    = sheet.get_column_index(re.compile('Added by'))
+        self.column_name    = sheet.get_column_index('Performer')
+        self.column_main_id = sheet.get_column_index('Main ID')
+        self.column_user    = sheet.get_column_index('Added by')
 
         self.data = self._parse(sheet.rows)
 
@@ -23,24 +23,24 @@ class DuplicatePerformers(BacklogBase):
         for row in rows:
             row = self._transform_row(row)
 
-            # already processed
-            if self.skip_done and row.done:
+            # already processed, not transformed
+            if (item := row.item) is None:
                 continue
             # empty row
-            if not row.item['main_id']:
+            if not item['main_id']:
                 continue
             # no duplicates listed
-            if not row.item['duplicates']:
+            if not item['duplicates']:
                 continue
 
-            data.append(row.item)
+            data.append(item)
 
         return data
 
     class RowResult(NamedTuple):
         num: int
         done: bool
-        item: DuplicatePerformersItem
+        item: Optional[DuplicatePerformersItem]
 
     def _transform_row(self, row: SheetRow) -> RowResult:
         try:
@@ -54,16 +54,21 @@ class DuplicatePerformers(BacklogBase):
                 print(error)
                 done = False
 
+        # already processed, skipped without looking at the rest of the row
+        if self.skip_done and done:
+            return self.RowResult(row.num, done, None)
+
         cell_name = row.cells[self.column_name]
         cells_duplicates = row.cells[self.column_main_id + 1:]
 
         notes = list(filter(str.strip, cell_name.note.splitlines()))
 
-        name: str = cell_name.value.strip()
-        main_id: str = row.cells[self.column_main_id].value.strip()
+        name: str = cell_name.value
+        # the same IDs show up across rows as main and duplicate IDs
+        main_id: str = sys.intern(row.cells[self.column_main_id].value)
         duplicate_ids = self._get_duplicate_performer_ids(cells_duplicates, notes, row.num)
         notes = list(dict.fromkeys(filter(None, notes)))
-        user: str = row.cells[self.column_user].value.strip()
+        user: str = row.cells[self.column_user].value
 
         if main_id and not is_uuid(main_id):
             if main_id != '-':
@@ -89,9 +94,10 @@ class DuplicatePerformers(BacklogBase):
 
     def _get_duplicate_performer_ids(self, cells: List[SheetCell], notes: List[str], row_num: int):
         results: List[str] = []
+        seen: Set[str] = set()
 
         for cell in cells:
-            p_id: str = cell.value.strip()
+            p_id: str = cell.value
 
             # skip empty
             if not p_id:
@@ -100,17 +106,18 @@ class DuplicatePerformers(BacklogBase):
             # skip completed
             if cell.done:
                 continue
-                print(f'Row {row_num:<4} | skipped completed {p_id}')
 
             # add everything else as notes
             if not is_uuid(p_id):
                 notes.append(cell.first_link or p_id)
                 continue
 
-            if p_id in results:
+            if p_id in seen:
                 print(f'Row {row_num:<4} | WARNING: Skipping duplicate performer ID: {p_id}')
                 continue
 
+            p_id = sys.intern(p_id)
+            seen.add(p_id)
             results.append(p_id)
 
         return results
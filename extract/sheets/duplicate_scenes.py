@@ -1,6 +1,6 @@
 # coding: utf-8
-import re
-from typing import List, NamedTuple
+import sys
+from typing import List, NamedTuple, Optional, Set
 
 from ..base import BacklogBase
 from ..classes import Sheet, SheetCell, SheetRow
@@ -10,27 +10,27 @@ from ..utils import is_uuid
 
 class DuplicateScenes(BacklogBase):
     def __init__(self, sheet: Sheet):
-        self.column_category = sheet.get_column_index(re.compile('Category'))
-        self.column_studio   = sheet.get_column_index(re.compile('Studio'))
-        self.column_main_id  = sheet.get_column_index(re.compile('Main ID'))
-        self.column_user     = sheet.get_column_index(re.compile('Added by'))
+        self.column_category = sheet.get_column_index('Category')
+        self.column_studio   = sheet.get_column_index('Studio')
+        self.column_main_id  = sheet.get_column_index('Main ID')
+        self.column_user     = sheet.get_column_index('Added by')
 
         self.data = self._parse(sheet.rows)
 
     def _parse(self, rows: List[SheetRow]) -> List[DuplicateScenesItem]:
         data: List[DuplicateScenesItem] = []
 
-        seen: List[int] = []
+        seen: Set[int] = set()
 
         for row in rows:
             row = self._transform_row(row)
 
-            # already processed
-            if row.done:
+            # already processed, not transformed
+            if (item := row.item) is None:
                 continue
 
-            main_id = row.item['main_id']
-            duplicate_ids = row.item['duplicates']
+            main_id = item['main_id']
+            duplicate_ids = item['duplicates']
             # useless row
             if not main_id or not duplicate_ids:
                 continue
@@ -39,16 +39,16 @@ class DuplicateScenes(BacklogBase):
             if compare in seen:
                 print(f'Row {row.num:<4} | WARNING: Skipping duplicate entry for scene ID: {main_id}')
                 continue
-            seen.append(compare)
+            seen.add(compare)
 
-            data.append(row.item)
+            data.append(item)
 
         return data
 
     class RowResult(NamedTuple):
         num: int
         done: bool
-        item: DuplicateScenesItem
+        item: Optional[DuplicateScenesItem]
 
     def _transform_row(self, row: SheetRow) -> RowResult:
         try:
@@ -57,11 +57,16 @@ class DuplicateScenes(BacklogBase):
             print(error)
             done = False
 
-        category: str = row.cells[self.column_category].value.strip()
-        studio: str = row.cells[self.column_studio].value.strip()
-        main_id: str = row.cells[self.column_main_id].value.strip()
+        # already processed, skipped without looking at the rest of the row
+        if done:
+            return self.RowResult(row.num, done, None)
+
+        category: str = row.cells[self.column_category].value
+        studio: str = row.cells[self.column_studio].value
+        # the same IDs show up across rows as main and duplicate IDs
+        main_id: str = sys.intern(row.cells[self.column_main_id].value)
         duplicates: List[str] = self._get_duplicate_scene_ids(row.cells[self.column_main_id + 1:], row.num)
-        user: str = row.cells[self.column_user].value.strip()
+        user: str = row.cells[self.column_user].value
 
         if main_id and not is_uuid(main_id):
             if main_id != '-':
@@ -80,9 +85,10 @@ class DuplicateScenes(BacklogBase):
 
     def _get_duplicate_scene_ids(self, cells: List[SheetCell], row_num: int) -> List[str]:
         results: List[str] = []
+        seen: Set[str] = set()
 
         for cell in cells:
-            scene_id: str = cell.value.strip()
+            scene_id: str = cell.value
 
             # skip empty
             if not scene_id:
@@ -95,12 +101,13 @@ class DuplicateScenes(BacklogBase):
             # skip completed
             if cell.done:
                 continue
-                print(f'Row {row_num:<4} | skipped completed {scene_id}')
 
-            if scene_id in results:
+            if scene_id in seen:
                 print(f'Row {row_num:<4} | WARNING: Skipping duplicate scene ID: {scene_id}')
                 continue
 
+            scene_id = sys.intern(scene_id)
+            seen.add(scene_id)
             results.append(scene_id)
 
         return results
@@ -36,11 +36,11 @@ class PerformerURLs(BacklogBase):
                     print(error)
                     done = False
 
-            name = row.cells[self.column_name].value.strip()
-            p_id = row.cells[self.column_p_id].value.strip()
-            url  = row.cells[self.column_url].value.strip()
-            # user = row.cells[self.column_user].value.strip()
-            text = row.cells[self.column_text].value.strip()
+            name = row.cells[self.column_name].value
+            p_id = row.cells[self.column_p_id].value
+            url  = row.cells[self.column_url].value
+            # user = row.cells[self.column_user].value
+            text = row.cells[self.column_text].value
 
             # useless row
             if not (p_id and url and name):
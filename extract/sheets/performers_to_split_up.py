@@ -33,9 +33,9 @@ class PerformersToSplitUp(BacklogBase):
         self.column_done = sheet.get_column_index('V')
         self.column_status = sheet.get_column_index(re.compile(r'Status|Claimed by'))
         self.column_name = sheet.get_column_index('Performer')
-        self.column_p_id = sheet.get_column_index(re.compile('Performer ID'))
-        self.column_user = sheet.get_column_index(re.compile('Added by'))
-        self.column_notes = sheet.get_column_index(re.compile('Notes'))
+        self.column_p_id = sheet.get_column_index('Performer ID')
+        self.column_user = sheet.get_column_index('Added by')
+        self.column_notes = sheet.get_column_index('Notes')
         self.columns_fragments = sheet.get_all_column_indices(re.compile(r'(Performer|Fragment) \d'))
 
         self.data = self._parse(sheet.rows)
@@ -72,12 +72,12 @@ class PerformersToSplitUp(BacklogBase):
         cells_fragments = [c for i, c in enumerate(row.cells) if i in self.columns_fragments]
 
         done_note: str = row.cells[self.column_done].note.strip()
-        status: str = row.cells[self.column_status].value.strip()
-        name: str = row.cells[self.column_name].value.strip()
-        p_id: str = row.cells[self.column_p_id].value.strip()
-        user: str = row.cells[self.column_user].value.strip()
+        status: str = row.cells[self.column_status].value
+        name: str = row.cells[self.column_name].value
+        p_id: str = row.cells[self.column_p_id].value
+        user: str = row.cells[self.column_user].value
         notes_c   = row.cells[self.column_notes]
-        notes: str = notes_c.value.strip()
+        notes: str = notes_c.value
         fragments = self._get_fragments(cells_fragments, row.num)
 
         if p_id and not is_uuid(p_id):
@@ -113,13 +113,12 @@ class PerformersToSplitUp(BacklogBase):
 
         for cell_num, cell in enumerate(cells, 1):
             # skip empty
-            if not cell.value.strip():
+            if not cell.value:
                 continue
 
             # skip completed
             if cell.done and self.skip_done_fragments:
                 continue
-                print(f'Row {row_num:<4} | skipped completed fragment {cell_num}: {cell.value}')
 
             if fragment := self._parse_fragment_cell(cell):
                 results.append(fragment)
@@ -131,7 +130,7 @@ class PerformersToSplitUp(BacklogBase):
     ST_LINK_PATTERN = re.compile(r'\u0002' + URL_PATTERN.pattern + r'\u0003')
 
     def _parse_fragment_cell(self, cell: SheetCell) -> Optional[SplitFragment]:
-        value = cell.value.strip()
+        value = cell.value
         lines = value.splitlines()
 
         first_line = lines.pop(0)
@@ -7,6 +7,8 @@ from ..classes import Sheet, SheetRow
 from ..models import SceneFingerprintsDict, SceneFingerprintsItem
 from ..utils import is_uuid, parse_duration
 
+HASH_PATTERN = re.compile(r'[a-f0-9]+')
+
 
 class SceneFingerprints(BacklogBase):
     def __init__(self, sheet: Sheet, skip_done: bool, skip_no_correct_scene: bool, with_user: bool = False):
@@ -14,12 +16,12 @@ class SceneFingerprints(BacklogBase):
         self.skip_no_correct_scene = skip_no_correct_scene
         self.with_user = with_user
 
-        self.column_scene_id = sheet.get_column_index(re.compile('Scene ID'))
-        self.column_algorithm = sheet.get_column_index(re.compile('Algorithm'))
-        self.column_fingerprint = sheet.get_column_index(re.compile('Fingerprint'))
-        self.column_correct_scene_id = sheet.get_column_index(re.compile('Correct Scene ID'))
-        self.column_duration = sheet.get_column_index(re.compile('Duration'))
-        self.column_user = sheet.get_column_index(re.compile('Added by'))
+        self.column_scene_id = sheet.get_column_index('Scene ID')
+        self.column_algorithm = sheet.get_column_index('Algorithm')
+        self.column_fingerprint = sheet.get_column_index('Fingerprint')
+        self.column_correct_scene_id = sheet.get_column_index('Correct Scene ID')
+        self.column_duration = sheet.get_column_index('Duration')
+        self.column_user = sheet.get_column_index('Added by')
 
         self.data = self._parse(sheet.rows)
 
@@ -34,12 +36,9 @@ class SceneFingerprints(BacklogBase):
                 print(error)
                 done = False
 
-            scene_id: str = row.cells[self.column_scene_id].value.strip()
-            algorithm: str = row.cells[self.column_algorithm].value.strip()
-            fp_hash: str = row.cells[self.column_fingerprint].value.strip()
-            correct_scene_id: Optional[str] = row.cells[self.column_correct_scene_id].value.strip() or None
-            duration: str = row.cells[self.column_duration].value.strip()
-            user: str = row.cells[self.column_user].value.strip()
+            scene_id: str = row.cells[self.column_scene_id].value
+            algorithm: str = row.cells[self.column_algorithm].value
+            fp_hash: str = row.cells[self.column_fingerprint].value
 
             last_row = last_seen.get(scene_id, None)
 
@@ -65,7 +64,7 @@ class SceneFingerprints(BacklogBase):
                 continue
 
             if (
-                re.fullmatch(r'^[a-f0-9]+$', fp_hash) is None
+                HASH_PATTERN.fullmatch(fp_hash) is None
                 or algorithm in ('phash', 'oshash') and len(fp_hash) != 16 and fp_hash != '0'
                 or algorithm == 'md5' and len(fp_hash) != 32
             ):
@@ -77,6 +76,11 @@ class SceneFingerprints(BacklogBase):
                 print(f'Row {row.num:<4} | WARNING: Skipped due to invalid scene ID: {scene_id}')
                 continue
 
+            # only read the rest of the row once it is known to be valid
+            correct_scene_id: Optional[str] = row.cells[self.column_correct_scene_id].value or None
+            duration: str = row.cells[self.column_duration].value
+            user: str = row.cells[self.column_user].value
+
             if self.skip_no_correct_scene and not correct_scene_id:
                 print(f'Row {row.num:<4} | WARNING: Skipped due to missing correct scene ID')
                 continue
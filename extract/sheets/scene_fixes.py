@@ -1,5 +1,4 @@
 # coding: utf-8
-import re
 from typing import Dict, List, NamedTuple, Optional
 
 from ..base import BacklogBase
@@ -7,16 +6,28 @@ from ..classes import Sheet, SheetRow
 from ..models import SceneChangeFieldType, SceneChangeItem, SceneFixesDict
 from ..utils import is_uuid, parse_duration
 
+SCENE_FIELDS: Dict[str, SceneChangeFieldType] = {
+    'Title': 'title',
+    'Description': 'details',
+    'Date': 'date',
+    'Studio ID': 'studio_id',
+    'Studio Code': 'code',
+    'Director': 'director',
+    'Duration': 'duration',
+    'Image': 'image',
+    'URL': 'url',
+}
+
 
 class SceneFixes(BacklogBase):
     def __init__(self, sheet: Sheet, skip_done: bool):
         self.skip_done = skip_done
 
-        self.column_scene_id   = sheet.get_column_index(re.compile('Scene ID'))
-        self.column_field      = sheet.get_column_index(re.compile('Field'))
-        self.column_new_data   = sheet.get_column_index(re.compile('New Data'))
-        self.column_correction = sheet.get_column_index(re.compile('Correction'))
-        self.column_user       = sheet.get_column_index(re.compile('Added by'))
+        self.column_scene_id   = sheet.get_column_index('Scene ID')
+        self.column_field      = sheet.get_column_index('Field')
+        self.column_new_data   = sheet.get_column_index('New Data')
+        self.column_correction = sheet.get_column_index('Correction')
+        self.column_user       = sheet.get_column_index('Added by')
 
         self.data = self._parse(sheet.rows)
 
@@ -68,15 +79,8 @@ class SceneFixes(BacklogBase):
                 print(error)
                 done = False
 
-        scene_id: str = row.cells[self.column_scene_id].value.strip()
-        field: str = row.cells[self.column_field].value.strip()
-        correction: Optional[str] = row.cells[self.column_correction].value.strip() or None
-        user: str = row.cells[self.column_user].value.strip()
-
-        new_data_cell = row.cells[self.column_new_data]
-        new_data = new_data_cell.first_link
-        if not new_data:
-            new_data = new_data_cell.value.strip() or None
+        scene_id: str = row.cells[self.column_scene_id].value
+        field: str = row.cells[self.column_field].value
 
         if not scene_id or done:
             return self.RowResult(row.num, done, scene_id, None)
@@ -95,6 +99,15 @@ class SceneFixes(BacklogBase):
             print(f'Row {row.num:<4} | ERROR: Field {field!r} is invalid.')
             return self.RowResult(row.num, done, scene_id, None)
 
+        # only read the rest of the row once it is known to be applicable
+        correction: Optional[str] = row.cells[self.column_correction].value or None
+        user: str = row.cells[self.column_user].value
+
+        new_data_cell = row.cells[self.column_new_data]
+        new_data = new_data_cell.first_link
+        if not new_data:
+            new_data = new_data_cell.value or None
+
         try:
             processed_new_data = self._transform_new_data(normalized_field, new_data)
         except SceneFixes.ValueWarning:
@@ -124,26 +137,10 @@ class SceneFixes(BacklogBase):
 
     @staticmethod
     def _normalize_field(field: str) -> SceneChangeFieldType:
-        if field == 'Title':
-            return 'title'
-        if field == 'Description':
-            return 'details'
-        if field == 'Date':
-            return 'date'
-        if field == 'Studio ID':
-            return 'studio_id'
-        if field == 'Studio Code':
-            return 'code'
-        if field == 'Director':
-            return 'director'
-        if field == 'Duration':
-            return 'duration'
-        if field == 'Image':
-            return 'image'
-        if field == 'URL':
-            return 'url'
-
-        raise ValueError(f'Unsupported field: {field}')
+        try:
+            return SCENE_FIELDS[field]
+        except KeyError:
+            raise ValueError(f'Unsupported field: {field}') from None
 
     @staticmethod
     def _transform_new_data(field: SceneChangeFieldType, value: Optional[str]) -> Optional[str]:
@@ -1,6 +1,9 @@
 # coding: utf-8
 import re
-from typing import Dict, List, NamedTuple, Optional, Tuple
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from ..base import BacklogBase
 from ..classes import Sheet, SheetCell, SheetRow
@@ -19,20 +22,32 @@ from ..utils import (
     parse_stashdb_url
 )
 
+PARENT_STUDIO_PATTERN = re.compile(r'^(?P<studio>.+?) \[(?P<parent_studio>.+)\]$')
+PERFORMER_NAME_PATTERN = re.compile(
+    r'(?:\[(?P<status>[a-z]+?)\] )?(?P<name>.+?)(?: \[(?P<dsmbg>.+?)\])?(?: \(as (?P<as>.+)\))?',
+    re.I
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_parent_studio(studio: str) -> Optional[Dict[str, str]]:
+    """Split `Studio [Parent Studio]`; cached since the same studios appear on most rows."""
+    if match := PARENT_STUDIO_PATTERN.fullmatch(studio):
+        return match.groupdict()
+    return None
+
 
 class ScenePerformers(BacklogBase):
     def __init__(self, sheet: Sheet, skip_done: bool, skip_no_id: bool):
         self.skip_done = skip_done
         self.skip_no_id = skip_no_id
 
-        self.column_studio   = sheet.get_column_index(re.compile('Studio'))
-        self.column_scene_id = sheet.get_column_index(re.compile('Scene ID'))
-        self.columns_remove  = sheet.get_all_column_indices(re.compile(r'\(\d+\) Remove/Replace'))
-        self.columns_append  = sheet.get_all_column_indices(re.compile(r'\(\d+\) Add/With'))
-        self.column_note     = sheet.get_column_index(re.compile('Edit Note'))
-        self.column_user     = sheet.get_column_index(re.compile('Added by'))
-
-        self._parent_studio_pattern = re.compile(r'^(?P<studio>.+?) \[(?P<parent_studio>.+)\]$')
+        self.column_studio   = sheet.get_column_index('Studio')
+        self.column_scene_id = sheet.get_column_index('Scene ID')
+        self.columns_remove  = tuple(sheet.get_all_column_indices(re.compile(r'\(\d+\) Remove/Replace')))
+        self.columns_append  = tuple(sheet.get_all_column_indices(re.compile(r'\(\d+\) Add/With')))
+        self.column_note     = sheet.get_column_index('Edit Note')
+        self.column_user     = sheet.get_column_index('Added by')
 
         self.data = self._parse(sheet.rows)
 
@@ -42,7 +57,6 @@ class ScenePerformers(BacklogBase):
             row = self._transform_row(row)
 
             scene_id = row.item['scene_id']
-            all_entries = get_all_entries(row.item)
 
             # already processed
             if not self.skip_done:
@@ -62,6 +76,8 @@ class ScenePerformers(BacklogBase):
                 print(f'Row {row.num:<4} | WARNING: Skipped due to invalid scene ID: {scene_id}')
                 continue
 
+            all_entries = get_all_entries(row.item)
+
             # no changes
             if len(all_entries) == 0:
                 if not row.item.get('comment'):
@@ -69,37 +85,22 @@ class ScenePerformers(BacklogBase):
                     continue
                 print(f'Row {row.num:<4} | WARNING: Contains no changes, only a comment.')
 
-            by_status: Dict[Optional[str], List[AnyPerformerEntry]] = {}
-            for entry in all_entries:
-                status = entry.get('status')
-                target = by_status.setdefault(status, [])
-                target.append(entry)
+            if self.skip_no_id:
+                by_status: DefaultDict[Optional[str], List[AnyPerformerEntry]] = defaultdict(list)
+                for entry in all_entries:
+                    by_status[entry.get('status')].append(entry)
+
+                # skip entries tagged with:
+                #   [merge] as they are marked to be merged into the paired performer
+                #   [edit] as they are marked to be edited and given the information of one of the to-append performers
+                #   [new] as they are marked to be created
+                if tag := next((t for t in ('merge', 'edit', 'new') if by_status[t]), None):
+                    print(
+                        f'Row {row.num:<4} | Skipped due to [{tag}]-tagged performers: '
+                        + ' , '.join(performer_name(i) for i in by_status[tag])
+                    )
+                    continue
 
-            # skip entries tagged with [merge] as they are marked to be merged into the paired performer
-            if self.skip_no_id and by_status.get('merge'):
-                formatted_merge_tagged = [performer_name(i) for i in by_status['merge']]
-                print(
-                    f'Row {row.num:<4} | Skipped due to [merge]-tagged performers: '
-                    + ' , '.join(formatted_merge_tagged)
-                )
-                continue
-            # skip entries tagged with [edit] as they are marked to be edited
-            #   and given the information of one of the to-append performers
-            if self.skip_no_id and by_status.get('edit'):
-                formatted_edit_tagged = [performer_name(i) for i in by_status['edit']]
-                print(
-                    f'Row {row.num:<4} | Skipped due to [edit]-tagged performers: '
-                    + ' , '.join(formatted_edit_tagged)
-                )
-                continue
-            # skip entries tagged with [new] as they are marked to be created
-            if self.skip_no_id and by_status.get('new'):
-                formatted_new_tagged = [performer_name(i) for i in by_status['new']]
-                print(
-                    f'Row {row.num:<4} | Skipped due to [new]-tagged performers: '
-                    + ' , '.join(formatted_new_tagged)
-                )
-                continue
             # If this item has any performers that do not have a StashDB ID,
             #   skip the whole item for now, to avoid unwanted deletions.
             if self.skip_no_id and (no_id := [i for i in all_entries if not i['id']]):
@@ -150,23 +151,24 @@ class ScenePerformers(BacklogBase):
                 print(error)
                 done = False
 
-        remove_cells = [c for i, c in enumerate(row.cells) if i in self.columns_remove]
-        append_cells = [c for i, c in enumerate(row.cells) if i in self.columns_append]
+        remove_cells = [row.cells[i] for i in self.columns_remove]
+        append_cells = [row.cells[i] for i in self.columns_append]
 
-        studio: str = row.cells[self.column_studio].value.strip()
-        scene_id: str = row.cells[self.column_scene_id].value.strip()
+        # studios and users repeat across most rows, keep a single copy of each
+        studio: str = sys.intern(row.cells[self.column_studio].value)
+        scene_id: str = row.cells[self.column_scene_id].value
         remove = self._get_change_entries(remove_cells, row.num)
         append = self._get_change_entries(append_cells, row.num)
         update = self._find_updates(remove, append, row.num)
 
         note_c = row.cells[self.column_note]
-        note   = note_c.value.strip()
+        note   = note_c.value
 
-        user: str = row.cells[self.column_user].value.strip()
+        user: str = sys.intern(row.cells[self.column_user].value)
 
         studio_info = {'studio': studio}
-        if studio and (parent_studio_match := self._parent_studio_pattern.fullmatch(studio)):
-            studio_info.update(parent_studio_match.groupdict())
+        if studio and (parent_studio_info := parse_parent_studio(studio)):
+            studio_info.update(parent_studio_info)
 
         item = ScenePerformersItem(
             **studio_info,
@@ -189,24 +191,31 @@ class ScenePerformers(BacklogBase):
 
     def _get_change_entries(self, cells: List[SheetCell], row_num: int):
         results: List[PerformerEntry] = []
+        seen: Set[Tuple[Optional[str], ...]] = set()
 
         for cell in cells:
             entry, raw_name = self._get_change_entry(cell, row_num)
 
             if not entry:
                 continue
-                print(f'skipped empty/comment/completed/invalid {raw_name}')
 
-            if entry in results:
+            # same fields as dict equality; `notes` is a list, so its lines are joined into the key
+            key = (
+                entry['id'], entry['name'], entry['appearance'],
+                entry.get('disambiguation'), entry.get('status'), entry.get('status_url'),
+                '\n'.join(entry['notes']) if 'notes' in entry else None,
+            )
+            if key in seen:
                 print(f'Row {row_num:<4} | WARNING: Skipping duplicate performer: {raw_name}')
                 continue
 
+            seen.add(key)
             results.append(entry)
 
         return results
 
     def _get_change_entry(self, cell: SheetCell, row_num: int) -> Tuple[Optional[PerformerEntry], str]:
-        raw_name: str = cell.value.strip()
+        raw_name: str = cell.value
 
         # skip empty
         if not raw_name or raw_name.startswith('>>>>>'):
@@ -219,13 +228,8 @@ class ScenePerformers(BacklogBase):
         # skip completed (legacy)
         if self.skip_done and cell.done:
             return None, raw_name
-            print(f'skipped completed {raw_name}')
 
-        match = re.fullmatch(
-            r'(?:\[(?P<status>[a-z]+?)\] )?(?P<name>.+?)(?: \[(?P<dsmbg>.+?)\])?(?: \(as (?P<as>.+)\))?',
-            raw_name,
-            re.I
-        )
+        match = PERFORMER_NAME_PATTERN.fullmatch(raw_name)
 
         if match:
             status = match.group('status')
@@ -284,17 +288,22 @@ class ScenePerformers(BacklogBase):
         Mutates `remove` & `append` when an update entry is found.
         """
         updates: List[PerformerUpdateEntry] = []
+        # identities of the entries that were combined into updates
+        paired: Set[int] = set()
 
-        remove_ids = [i['id'] for i in remove]
-        append_ids = [i['id'] for i in append]
-        update_ids = [i for i in append_ids if i in remove_ids]
+        remove_by_id: Dict[str, PerformerEntry] = {}
+        for r_item in remove:
+            if r_item['id']:
+                remove_by_id.setdefault(r_item['id'], r_item)
 
-        for pid in update_ids:
-            if pid is None:
-                continue
+        append_by_id: Dict[str, PerformerEntry] = {}
+        for a_item in append:
+            if a_item['id']:
+                append_by_id.setdefault(a_item['id'], a_item)
 
-            r_item = remove[remove_ids.index(pid)]
-            a_item = append[append_ids.index(pid)]
+        for pid, a_item in append_by_id.items():
+            if (r_item := remove_by_id.get(pid)) is None:
+                continue
 
             # This is either not an update, or the one of IDs is incorrect,
             #   unless this is the aftermath of an edited performer.
@@ -319,11 +328,12 @@ class ScenePerformers(BacklogBase):
                 u_item['status'] = a_item['status']
 
             updates.append(u_item)
+            paired.update((id(r_item), id(a_item)))
 
         # Remove the items from remove & append
-        for u_item in updates:
-            remove.remove(next(r for r in remove if r['id'] == u_item['id']))
-            append.remove(next(a for a in append if a['id'] == u_item['id']))
+        if paired:
+            remove[:] = [r for r in remove if id(r) not in paired]
+            append[:] = [a for a in append if id(a) not in paired]
 
         return updates
 
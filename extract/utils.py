@@ -1,10 +1,10 @@
 import os
 import re
-from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Literal, Optional, Tuple
 
 from .models import AnyPerformerEntry, ScenePerformersItem
-from .paths import script_dir
+from .paths import env_file
 
 UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
 STASHDB_UUID_PATTERN = re.compile(rf'/([a-z]+)/({UUID_PATTERN.pattern})')
@@ -12,20 +12,22 @@ URL_PATTERN = re.compile(r'(https?://[^\s]+)')
 
 
 def is_uuid(text: str) -> bool:
-    return UUID_PATTERN.fullmatch(text) is not None
+    return len(text) == 36 and UUID_PATTERN.fullmatch(text) is not None
 
 
 def parse_duration(text: Optional[str]) -> Optional[int]:
     if not text:
         return None
-    try:
-        parts = text.split(':')
-    except AttributeError:
-        return None
 
-    parts[0:0] = ('0',) * (3 - len(parts))
-    (hours, minutes, seconds) = [int(i) for i in parts]
-    return hours * 3600 + minutes * 60 + seconds
+    # [[hours:]minutes:]seconds
+    parts = text.split(':')
+    if len(parts) > 3:
+        raise ValueError(f'Invalid duration: {text!r}')
+
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
 
 
 def parse_stashdb_url(url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -36,16 +38,13 @@ def parse_stashdb_url(url: str) -> Tuple[Optional[str], Optional[str]]:
 
 
 def first_performer_name(item: ScenePerformersItem, entry_type: Literal['update', 'append', 'remove']) -> str:
-    try:
-        entries = item.get(entry_type, [])
-        return entries[0]['name']
-    except IndexError:
-        return ''
+    entries = item.get(entry_type)
+    return entries[0]['name'] if entries else ''
 
 
 def get_all_entries(item: ScenePerformersItem) -> List[AnyPerformerEntry]:
-    remove, append, update = item['remove'], item['append'], item.get('update', [])
-    return remove + append + update  # type: ignore
+    # one allocation, rather than an intermediate list per `+`
+    return [*item['remove'], *item['append'], *item.get('update', [])]
 
 
 def performer_name(p: AnyPerformerEntry) -> str:
@@ -53,16 +52,11 @@ def performer_name(p: AnyPerformerEntry) -> str:
     p_dsmbg = p.get('disambiguation')
     p_as = p['appearance']
 
-    parts = []
-
     if p_as:
-        parts.extend((p_as, f'({p_name})'))
-    elif p_dsmbg:
-        parts.extend((p_name, f'[{p_dsmbg}]'))
-    else:
-        parts.append(p_name)
-
-    return ' '.join(parts)
+        return f'{p_as} ({p_name})'
+    if p_dsmbg:
+        return f'{p_name} [{p_dsmbg}]'
+    return p_name
 
 
 def format_studio(item: ScenePerformersItem) -> Optional[str]:
@@ -75,16 +69,18 @@ def format_studio(item: ScenePerformersItem) -> Optional[str]:
     return studio
 
 
+@lru_cache(maxsize=None)
 def get_env() -> Dict[str, str]:
     env: Dict[str, str] = {}
     try:
-        dotenv = Path(script_dir / '.env').read_text()
+        dotenv = env_file.read_text()
     except FileNotFoundError:
         return env
 
     for line in dotenv.splitlines():
-        if not line.startswith('#'):
-            key, value = line.split('=')
+        # blank lines and stray text without a `=` are skipped along with comments
+        key, sep, value = line.strip().partition('=')
+        if sep and not key.startswith('#'):
             env[key] = value
     return env
 
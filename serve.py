@@ -1,17 +1,73 @@
 #!/usr/bin/env python3.11
-from http.server import SimpleHTTPRequestHandler
+import os
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from socketserver import TCPServer
 
 PORT = 8000
 here = Path(__file__).parent / 'cache'
 
 
 class Handler(SimpleHTTPRequestHandler):
+    # send headers right away rather than letting Nagle hold them back for the body
+    disable_nagle_algorithm = True
 
     def __init__(self, *args, **kwargs):
+        self.etag = None
         super().__init__(*args, directory=str(here), **kwargs)
 
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isfile(path):
+            st = os.stat(path)
+            self.etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if self.etag_matches(self.headers.get('If-None-Match')):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return None
+
+        return super().send_head()
+
+    def etag_matches(self, header):
+        if not header:
+            return False
+
+        for tag in header.split(','):
+            tag = tag.strip()
+            if tag == '*':
+                return True
+            # If-None-Match uses weak comparison
+            if tag.removeprefix('W/') == self.etag:
+                return True
+
+        return False
+
+    def copyfile(self, source, outputfile):
+        try:
+            infd = source.fileno()
+        except OSError:
+            # directory listings are served from memory
+            return super().copyfile(source, outputfile)
+
+        if not hasattr(os, 'sendfile'):
+            # not available on Windows
+            return super().copyfile(source, outputfile)
+
+        outputfile.flush()
+        outfd = self.connection.fileno()
+        offset, size = 0, os.fstat(infd).st_size
+        while offset < size:
+            try:
+                sent = os.sendfile(outfd, infd, offset, size - offset)
+            except OSError:
+                if offset:
+                    raise
+                # unsupported by the socket or filesystem; nothing has been sent yet
+                return super().copyfile(source, outputfile)
+            if sent == 0:
+                break
+            offset += sent
+
     def end_headers(self):
         self.send_my_headers()
 
@@ -20,6 +76,8 @@ class Handler(SimpleHTTPRequestHandler):
     def send_my_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Cache-Control', 'no-cache')
+        if self.etag:
+            self.send_header('ETag', self.etag)
 
 
 if __name__ == '__main__':
@@ -27,7 +85,7 @@ if __name__ == '__main__':
         print('first, run: python make_backlog_data.py cache')
         exit(1)
 
-    with TCPServer(('', PORT), Handler) as httpd:
+    with ThreadingHTTPServer(('', PORT), Handler) as httpd:
         print(f'serving at port {PORT}')
         try:
             httpd.serve_forever()